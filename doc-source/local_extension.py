@@ -1,12 +1,62 @@
 # stdlib
-from typing import Optional
+import os
+import tempfile
+from typing import TYPE_CHECKING, Optional
 
 # 3rd party
 from domdf_python_tools.paths import PathPlus
-from sphinx.application import Sphinx
 
+if TYPE_CHECKING:
+	# 3rd party
+	from sphinx.application import Sphinx
 
-def replace_environment_variables_header(app: Sphinx, exception: Optional[Exception] = None):
+_CHUNK_SIZE = 1 << 18
+
+
+def _replace_in_file(filename: PathPlus, old: bytes, new: bytes) -> None:
+	# Streams the file through a temporary file in the same directory,
+	# holding back enough of each chunk to catch matches spanning two chunks.
+
+	keep = len(old) - 1
+
+	with tempfile.NamedTemporaryFile(dir=filename.parent, delete=False) as dst:
+		try:
+			with open(filename, "rb") as src:
+				pending = b''
+
+				while True:
+					chunk = src.read(_CHUNK_SIZE)
+					if not chunk:
+						break
+
+					data = pending + chunk
+					pos = 0
+
+					while True:
+						idx = data.find(old, pos)
+						if idx == -1:
+							break
+
+						dst.write(data[pos:idx])
+						dst.write(new)
+						pos = idx + len(old)
+
+					safe = max(pos, len(data) - keep)
+					dst.write(data[pos:safe])
+					pending = data[safe:]
+
+				dst.write(pending)
+
+		except BaseException:
+			dst.close()
+			os.unlink(dst.name)
+			raise
+
+	os.chmod(dst.name, os.stat(filename).st_mode)
+	os.replace(dst.name, filename)
+
+
+def replace_environment_variables_header(app: "Sphinx", exception: Optional[Exception] = None):
 	if exception:
 		return
 
@@ -15,16 +65,13 @@ def replace_environment_variables_header(app: Sphinx, exception: Optional[Except
 
 	output_file = PathPlus(app.builder.outdir) / f"{app.builder.titles[0][1]}.tex"
 
-	output_content = output_file.read_text()
-
-	output_content = output_content.replace(
-			r"\subsubsection*{Environment variables}",
-			r"\vspace{20px}{\textcolor{TitleColor}{\sffamily\bfseries Environment variables}}",
+	_replace_in_file(
+			output_file,
+			rb"\subsubsection*{Environment variables}",
+			rb"\vspace{20px}{\textcolor{TitleColor}{\sffamily\bfseries Environment variables}}",
 			)
 
-	output_file.write_clean(output_content)
-
 
-def setup(app: Sphinx):
+def setup(app: "Sphinx"):
 	app.connect("build-finished", replace_environment_variables_header)
 	pass
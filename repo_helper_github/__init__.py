@@ -27,10 +27,17 @@ Manage GitHub repositories with ``repo-helper``.
 #
 
 # stdlib
+import datetime
+import os
 import tempfile
-from contextlib import suppress
+import time
+import weakref
+from base64 import b64encode
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, suppress
+from functools import lru_cache
 from getpass import getpass
-from typing import Callable, Dict, Iterator, Optional, Tuple, Union
+from typing import Any, Callable, Dict, FrozenSet, Iterator, List, Optional, Tuple, Union
 
 # 3rd party
 import click
@@ -39,21 +46,19 @@ from consolekit.terminal_colours import ColourTrilean, Fore, resolve_color_defau
 from deprecation_alias import deprecated
 from domdf_python_tools.paths import PathPlus
 from domdf_python_tools.typing import PathLike
-from dulwich.errors import NotGitRepository
-from dulwich.porcelain import fetch
 from github3 import GitHub, orgs, repos, users
-from github3.exceptions import NotFoundError
-from github3.repos import contents
-from github3.repos.branch import Branch
+from github3.exceptions import NotFoundError, error_for
+from github3_utils import RateLimitExceeded
 from github3_utils import echo_rate_limit as _utils_echo_rate_limit
 from github3_utils import get_user as _utils_get_user
-from github3_utils import protect_branch, secrets
-from github3_utils.check_labels import check_status_labels
+from github3_utils import secrets
+from github3_utils.headers import LUKE_CAKE  # LUKE_CAGE is only exported from github3-utils 0.7.0
+from nacl import encoding, public
 from packaging.version import InvalidVersion, Version
 from repo_helper.core import RepoHelper
 from repo_helper.files.ci_cd import ActionsManager, platform_ci_names
 from repo_helper.utils import set_gh_actions_versions
-from southwark.repo import Repo
+from requests import Response
 
 # this package
 from repo_helper_github._github import Github
@@ -100,8 +105,35 @@ get_user = deprecated(
 		)
 
 
+# GitHub only accepts ASCII topics, so lowercasing and replacing underscores can be done in a single pass.
+_LOWER_TABLE = {c: c + 32 for c in range(ord('A'), ord('Z') + 1)}
+_LOWER_TABLE[ord('_')] = ord('-')
+
+
 def _lower(string: str) -> str:
-	return string.lower().replace('_', '-')
+	return string.translate(_LOWER_TABLE)
+
+
+def _get_json(repo: repos.Repository, url: str, headers: Dict[str, str]) -> Any:
+	# Single place for the JSON GET requests made directly against the API.
+
+	response = repo._get(url, headers=headers)
+
+	if response.status_code != 200:
+		raise error_for(response)
+
+	return response.json()
+
+
+def _error_message(response: Response) -> Optional[str]:
+	# Returns the message from the body of an error response, if there is one.
+
+	try:
+		body = response.json()
+	except ValueError:
+		return None
+
+	return body.get("message") if isinstance(body, dict) else None
 
 
 class GitHubManager(RepoHelper):
@@ -152,14 +184,75 @@ class GitHubManager(RepoHelper):
 		self.github = Github(token=token)
 		self.verbose = verbose
 		self.colour = resolve_color_default(colour)
+		self._authenticated_user: Optional[users.User] = None
 		self.load_settings()
 
-	def echo_rate_limit(self):
+	def load_settings(self, *args, **kwargs) -> None:
+		"""
+		Load settings from the ``repo_helper.yml`` file in the repository.
+
+		Any arguments are passed to :meth:`repo_helper.core.RepoHelper.load_settings`.
+		"""
+
+		# Older versions of repo_helper take no arguments, and call this method from RepoHelper.__init__.
+		super().load_settings(*args, **kwargs)
+		self._reset_caches()
+
+	def _reset_caches(self) -> None:
+		# Clears everything looked up or computed from the configuration.
+		# The owner and repository depend on the configured username and repo_name.
+
+		self._user_cache: Dict[bool, Union[orgs.Organization, users.User]] = {}
+		self._repo_cache: Dict[Tuple[bool, str], repos.Repository] = {}
+		self._repo_kwargs: Optional[_EditKwargs] = None
+		self._desired_topics: Optional[FrozenSet[str]] = None
+
+	@contextmanager
+	def echo_rate_limit(self) -> Iterator[GitHub]:
 		"""
 		Contextmanager to echo the GitHub API rate limit before and after making a series of requests.
+
+		.. versionchanged:: 0.9.0
+
+			The rate limit after the requests is taken from the headers of the last response,
+			rather than by making an additional request.
+
+			When not verbose the rate limit is only checked against previous responses,
+			without a request being made to ``/rate_limit``.
+
+			Nothing is echoed afterwards if no requests were made.
+
+		:raises: :exc:`github3_utils.RateLimitExceeded` if the rate limit has been exceeded.
 		"""
 
-		return _utils_echo_rate_limit(self.github, self.verbose)
+		if self.verbose:
+			rate = self.github.rate_limit()["rate"]
+		else:
+			rate = getattr(self.github, "last_rate", None)
+
+		# A limit recorded from an earlier response no longer applies once its reset time has passed.
+		if rate is not None and not rate["remaining"] and rate["reset"] > time.time():
+			raise RateLimitExceeded(datetime.datetime.fromtimestamp(rate["reset"]))
+
+		if self.verbose:
+			remaining_requests = rate["remaining"]
+			click.echo(f"{remaining_requests} requests available.")
+
+		last_rate = getattr(self.github, "last_rate", None)
+
+		yield self.github
+
+		if self.verbose:
+			if last_rate is not None and getattr(self.github, "last_rate", None) is last_rate:
+				# No API requests were made, so there is nothing to report.
+				return
+
+			rate = getattr(self.github, "last_rate", None) or self.github.rate_limit()["rate"]
+			new_remaining_requests = rate["remaining"]
+			used_requests = remaining_requests - new_remaining_requests
+			reset = datetime.datetime.fromtimestamp(rate["reset"])
+
+			click.echo(f"Used {used_requests} requests. {new_remaining_requests} remaining. Resets at {reset}")
 
 	def new(self, org: bool = False) -> int:
 		"""
@@ -176,6 +269,10 @@ class GitHubManager(RepoHelper):
 			* Added the ``org`` argument.
 		"""
 
+		# 3rd party
+		from dulwich.errors import NotGitRepository
+		from southwark.repo import Repo
+
 		with self.echo_rate_limit():
 			user = self.get_org_or_user(org)
 			repo_name = self.templates.globals["repo_name"]
@@ -190,20 +287,21 @@ class GitHubManager(RepoHelper):
 			if repo is None:
 				raise ErrorCreatingRepository(user.login, repo_name, org=org)
 
+			self._repo_cache[(org, repo_name)] = repo
 			self.update_topics(repo)
 			click.echo(f"Success! View the repository online at {repo.html_url}")
 
-			try:
-				dulwich_repo = Repo(self.target_repo)
-			except NotGitRepository:
-				return 0
+		try:
+			dulwich_repo = Repo(self.target_repo)
+		except NotGitRepository:
+			return 0
 
-			config = dulwich_repo.get_config()
-			config.set(("remote", "origin"), "url", repo.ssh_url.encode("UTF-8"))
-			config.set(("remote", "origin"), "fetch", b"+refs/heads/*:refs/remotes/origin/*")
-			config.write_to_path()
+		config = dulwich_repo.get_config()
+		config.set(("remote", "origin"), "url", repo.ssh_url.encode("UTF-8"))
+		config.set(("remote", "origin"), "fetch", b"+refs/heads/*:refs/remotes/origin/*")
+		config.write_to_path()
 
-			fetch(dulwich_repo, remote_location="origin")
+		# The repository was only just created and has no commits, so there is nothing to fetch.
 
 		return 0
 
@@ -223,23 +321,43 @@ class GitHubManager(RepoHelper):
 		"""
 
 		with self.echo_rate_limit():
-			user = self.get_org_or_user(org)
-			repo_name = self.templates.globals["repo_name"]
-			repo: repos.Repository = self._get_repository(user, repo_name, org)
+			repo: repos.Repository = self._get_repo(org)
 
 			# TODO: add config option for allow_merge_commit
+			edit_kwargs = {**self.get_repo_kwargs(), "allow_merge_commit": False}
 
-			repo.edit(
-					name=repo.name,
-					**self.get_repo_kwargs(),
-					allow_merge_commit=False,
-					)
+			# The metadata and topics are independent, so update them concurrently.
+			with ThreadPoolExecutor(max_workers=2) as executor:
+				futures = [executor.submit(self.update_topics, repo)]
+
+				# Only edit the repository if its metadata differs from the configuration.
+				if any(getattr(repo, key, None) != value for key, value in edit_kwargs.items()):
+					futures.append(executor.submit(repo.edit, name=repo.name, **edit_kwargs))
+
+				for future in futures:
+					future.result()
 
-			self.update_topics(repo)
 			click.echo("Up to date!")
 
 		return 0
 
+	def _get_repo(self, org: bool = False) -> repos.Repository:
+		"""
+		Returns the GitHub repository for this project, fetching it on first use.
+
+		:param org: Whether the repository belongs to the organization set as ``username``,
+			or to the authenticated user (default).
+		"""
+
+		repo_name = self.templates.globals["repo_name"]
+		key = (org, repo_name)
+
+		if key not in self._repo_cache:
+			user = self.get_org_or_user(org)
+			self._repo_cache[key] = self._get_repository(user, repo_name, org)
+
+		return self._repo_cache[key]
+
 	def _get_repository(
 			self,
 			user: Union[users.User, orgs.Organization],
@@ -264,19 +382,29 @@ class GitHubManager(RepoHelper):
 		If ``org`` is :py:obj:`False`, returns the :class:`~github3.users.AuthenticatedUser` object representing the
 		GitHub user that owns the repository.
 
+		The result is cached until :meth:`~.load_settings` is next called.
+
 		.. versionadded:: 0.3.0
 
 		:param org:
 		"""  # noqa: D400
 
-		user = _utils_get_user(self.github)
+		if org in self._user_cache:
+			return self._user_cache[org]
+
+		if self._authenticated_user is None:
+			self._authenticated_user = _utils_get_user(self.github)
+
+		user = self._authenticated_user
 
 		if org:
-			self.assert_org_member(user)
-			return self.github.organization(self.templates.globals["username"])
+			owner = self.assert_org_member(user)
 		else:
 			self.assert_matching_usernames(user)
-			return user
+			owner = user
+
+		self._user_cache[org] = owner
+		return owner
 
 	def secrets(
 			self,
@@ -304,22 +432,35 @@ class GitHubManager(RepoHelper):
 		"""
 
 		with self.echo_rate_limit():
-			user = self.get_org_or_user(org)
-			repo_name = self.templates.globals["repo_name"]
-			repo: repos.Repository = self._get_repository(user, repo_name, org)
+			repo: repos.Repository = self._get_repo(org)
 
-			# List of existing secrets.
-			existing_secrets = secrets.get_secrets(repo)
+			# All requests go through the repository's session, which keeps the connection alive.
+			secrets_url = secrets.build_secrets_url(repo)
+			headers = repo.PREVIEW_HEADERS
 
-			# Public key to encrypt secrets with.
-			public_key = secrets.get_public_key(repo)
+			# The list of existing secrets and the public key to encrypt secrets with are independent.
+			with ThreadPoolExecutor(max_workers=2) as executor:
+				raw_secrets_future = executor.submit(_get_json, repo, str(secrets_url), headers)
+				public_key_future = executor.submit(_get_json, repo, str(secrets_url / "public-key"), headers)
+
+				existing_secrets = frozenset(secret["name"] for secret in raw_secrets_future.result()["secrets"])
+				public_key = public_key_future.result()
+
+			sealed_box = public.SealedBox(
+					public.PublicKey(public_key["key"].encode("UTF-8"), encoding.Base64Encoder()),  # type: ignore[arg-type]
+					)
 
 			ret = 0
 			target_secrets: Dict[str, Callable[[str], Tuple[bool, str]]] = {"PYPI_TOKEN": validate_pypi_token}
+			provided_secrets = {"PYPI_TOKEN": PYPI_TOKEN, "ANACONDA_TOKEN": ANACONDA_TOKEN}
 
 			if self.templates.globals["enable_conda"]:
 				target_secrets["ANACONDA_TOKEN"] = no_op_validator
 
+			# Mapping of secret names to the operation and encrypted value, filled in serially
+			# as the prompts cannot be shared between threads.
+			to_upload: Dict[str, Tuple[str, str]] = {}
+
 			for secret_name in sorted(target_secrets):
 				if overwrite is not None:
 					update = True
@@ -332,7 +473,7 @@ class GitHubManager(RepoHelper):
 				if update:
 					operation = "update" if secret_name in existing_secrets else "create"
 
-					secret_value = locals().get(secret_name, None) or getpass(f"{secret_name}: ")
+					secret_value = provided_secrets.get(secret_name) or getpass(f"{secret_name}: ")
 
 					valid, invalid_reason = target_secrets[secret_name](secret_value)
 					if not valid:
@@ -340,20 +481,29 @@ class GitHubManager(RepoHelper):
 								f"The value for {secret_name} does not appear to be valid: {invalid_reason}"
 								)
 
-					response = secrets.set_secret(
-							repo,
-							secret_name=secret_name,
-							value=secret_value,
-							public_key=public_key,
-							)
-
-					if response.status_code not in {200, 201, 204}:
-						message = f"Could not {operation} the secret {secret_name!r}: Status {response.status_code}"
-						click.echo(Fore.YELLOW(message), color=self.colour)
-						ret |= 1
-					else:
-						message = f"Successfully {operation}d the secret {secret_name!r}."
-						click.echo(Fore.GREEN(message), color=self.colour)
+					encrypted_value = b64encode(sealed_box.encrypt(secret_value.encode("UTF-8"))).decode("ascii")
+					to_upload[secret_name] = (operation, encrypted_value)
+
+			def put_secret(secret_name: str) -> Response:
+				return repo._put(
+						str(secrets_url / secret_name),
+						headers=headers,
+						json={"encrypted_value": to_upload[secret_name][1], "key_id": public_key["key_id"]},
+						)
+
+			with ThreadPoolExecutor(max_workers=4) as executor:
+				responses = list(executor.map(put_secret, to_upload))
+
+			for secret_name, response in zip(to_upload, responses):
+				operation = to_upload[secret_name][0]
+
+				if response.status_code not in {200, 201, 204}:
+					message = f"Could not {operation} the secret {secret_name!r}: Status {response.status_code}"
+					click.echo(Fore.YELLOW(message), color=self.colour)
+					ret |= 1
+				else:
+					message = f"Successfully {operation}d the secret {secret_name!r}."
+					click.echo(Fore.GREEN(message), color=self.colour)
 
 		return ret
 
@@ -380,20 +530,32 @@ class GitHubManager(RepoHelper):
 		"""
 
 		with self.echo_rate_limit():
-			user = self.get_org_or_user(org)
-			repo_name = self.templates.globals["repo_name"]
-			repo: repos.Repository = self._get_repository(user, repo_name, org)
-
-			gh_branch: Optional[Branch] = repo.branch(branch)
-			if not gh_branch:
-				raise NoSuchBranch(user.login, repo_name, branch)
+			repo: repos.Repository = self._get_repo(org)
 
 			required_checks = list(compile_required_checks(self))
 
-			protect_branch(gh_branch, status_checks=required_checks)
+			# The branch is addressed by name, so there is no need to fetch it first;
+			# GitHub responds with a 404 if it does not exist.
+			response = repo._put(
+					repo._build_url("branches", branch, "protection", base_url=repo._api),
+					json={
+							"required_status_checks": {"strict": False, "contexts": required_checks},
+							"enforce_admins": None,
+							"required_pull_request_reviews": {
+									"dismiss_stale_reviews": False,
+									"required_approving_review_count": 1,
+									},
+							"restrictions": None,
+							},
+					headers=LUKE_CAKE,
+					)
+
+			if response.status_code != 200:
+				# GitHub also responds with a 404 when the token lacks admin rights on the repository.
+				if response.status_code == 404 and _error_message(response) == "Branch not found":
+					raise NoSuchBranch(repo.owner.login, repo.name, branch)
 
-			# This seems to only work if its run twice
-			protect_branch(gh_branch, status_checks=required_checks)
+				raise error_for(response)
 
 		click.echo("Up to date!")
 		return 0
@@ -411,15 +573,19 @@ class GitHubManager(RepoHelper):
 			raise BadUsername(
 					f"The username configured in 'repo_helper.yml' ({username}) "
 					f"differs from that of the authenticated user ({user.login})!\n"
-					f"If {self.templates.globals['username']!r} is an organization you should use the --org flag.",
+					f"If {username!r} is an organization you should use the --org flag.",
 					username=username,
 					)
 
-	def assert_org_member(self, user: users.User):
+	def assert_org_member(self, user: users.User) -> orgs.Organization:
 		"""
 		Assert that the organization configured in ``repo_helper.yml`` exists, and the authenticated user is a member.
 
 		:param user:
+
+		:returns: The organization, so callers need not look it up again.
+
+		.. versionchanged:: 0.9.0  Now returns the :class:`~github3.orgs.Organization`.
 		"""
 
 		username = self.templates.globals["username"]
@@ -439,6 +605,8 @@ class GitHubManager(RepoHelper):
 		if not org.is_member(user.login):
 			raise error()
 
+		return org
+
 	def update_topics(self, repo: repos.Repository):
 		"""
 		Update the repository's topics.
@@ -447,29 +615,38 @@ class GitHubManager(RepoHelper):
 		"""
 		# TODO: other languages detected in repo
 
+		if self._desired_topics is None:
+			keywords = self.templates.globals["keywords"]
+			self._desired_topics = frozenset(_lower(topic) for topic in ("python", *keywords))
+
 		raw_topics = repo.topics()
-		if raw_topics is None:
-			topics = set()
-		else:
-			topics = set(raw_topics.names)
+		existing_topics = () if raw_topics is None else raw_topics.names
+
+		topics = self._desired_topics.union(map(_lower, existing_topics))
 
-		topics.add("python")
-		topics.update(self.templates.globals["keywords"])
-		repo.replace_topics(sorted(map(_lower, topics)))
+		if topics != set(existing_topics):
+			repo.replace_topics(sorted(topics))
 
 	def get_repo_kwargs(self) -> _EditKwargs:
 		r"""
 		Returns the keyword arguments used when creating and updating repositories.
 
+		The result is computed once per call to :meth:`~.load_settings`.
+
 		:rtype: :class:`~.typing.Dict`\[:class:`str`, :py:obj:`~.typing.Union`\[:class:`str`, :class:`bool`]]
 		"""
 
-		edit_kwargs: _EditKwargs = {"description": self.templates.globals["short_desc"]}
+		if self._repo_kwargs is None:
+			g = self.templates.globals
+			edit_kwargs: _EditKwargs = {"description": g["short_desc"]}
+
+			if g["enable_docs"]:
+				edit_kwargs["homepage"] = g["docs_url"]
 
-		if self.templates.globals["enable_docs"]:
-			edit_kwargs["homepage"] = self.templates.globals["docs_url"]
+			self._repo_kwargs = edit_kwargs
 
-		return edit_kwargs
+		# Return a copy, as callers may add to it.
+		return self._repo_kwargs.copy()
 
 	def create_labels(self, org: bool = False) -> int:
 		"""
@@ -481,19 +658,28 @@ class GitHubManager(RepoHelper):
 			or for the authenticated user (default).
 		"""
 
+		# 3rd party
+		from github3_utils.check_labels import Label, check_status_labels
+
 		with self.echo_rate_limit():
-			user = self.get_org_or_user(org)
-			repo_name = self.templates.globals["repo_name"]
-			repo: repos.Repository = self._get_repository(user, repo_name, org)
+			repo: repos.Repository = self._get_repo(org)
 
 			current_labels = {label.name: label for label in repo.labels()}
+			target_labels = list(check_status_labels.values())
 
-			for label in check_status_labels.values():
+			def sync_label(label: Label) -> bool:
 				if label.name in current_labels:
 					current_labels[label.name].update(**label.to_dict())
+					return False
 				else:
 					label.create(repo)
-					click.echo(f"Created label {label.name}")
+					return True
+
+			# Each label is independent, but report creations in the usual order.
+			with ThreadPoolExecutor(max_workers=4) as executor:
+				for label, created in zip(target_labels, executor.map(sync_label, target_labels)):
+					if created:
+						click.echo(f"Created label {label.name}")
 
 		click.echo("Up to date!")
 
@@ -514,6 +700,25 @@ encrypt_secret.__doc__ = (encrypt_secret.__doc__ or '').replace(
 		)
 
 
+_STATIC_CHECKS = (f"mypy / {platform_ci_names['Linux']}", "Flake8")
+
+# Versions which are tested on CI but are not required to pass.
+_OPTIONAL_VERSIONS = frozenset({"pypy-3.7"})
+
+
+@lru_cache()
+def _is_required_version(version: str) -> bool:
+	# Most versions are shared between platforms, so only parse each one once.
+
+	if version in _OPTIONAL_VERSIONS:
+		return False
+
+	with suppress(InvalidVersion):
+		return not Version(version).is_prerelease
+
+	return True
+
+
 def compile_required_checks(repo: RepoHelper) -> Iterator[str]:
 	"""
 	Returns an iterator over the names of required checks for the given repository.
@@ -523,37 +728,26 @@ def compile_required_checks(repo: RepoHelper) -> Iterator[str]:
 	:param repo:
 	"""
 
+	g = repo.templates.globals
 	actions_manager = ActionsManager(repo.target_repo, repo.templates)
 
-	for platform in repo.templates.globals["platforms"]:
-		if platform not in platform_ci_names:
-			continue
+	version_getters: Dict[str, Callable[[], List[str]]] = {
+			"Windows": actions_manager.get_windows_ci_versions,
+			"Linux": actions_manager.get_linux_ci_versions,
+			# "macOS": actions_manager.get_macos_ci_versions,
+			}
 
-		if platform == "Windows":
-			ci_platform = platform_ci_names[platform]
-			py_versions = actions_manager.get_windows_ci_versions()
-		elif platform == "Linux":
-			ci_platform = platform_ci_names[platform]
-			py_versions = actions_manager.get_linux_ci_versions()
-		# elif platform == "macOS":
-		# 	ci_platform = platform_ci_names[platform]
-		# 	py_versions = actions_manager.get_macos_ci_versions()
-		else:
+	for platform in g["platforms"]:
+		if platform not in version_getters:
 			continue
 
-		for version in set_gh_actions_versions(py_versions):
-			if version == "pypy-3.7":
-				continue
+		for version in set_gh_actions_versions(version_getters[platform]()):
+			if _is_required_version(version):
+				yield f"{platform_ci_names[platform]} / Python {version}"
 
-			with suppress(InvalidVersion):
-				if Version(version).is_prerelease:
-					continue
+	yield from _STATIC_CHECKS
 
-			yield f"{ci_platform} / Python {version}"
-
-	yield from [f"mypy / {platform_ci_names['Linux']}", "Flake8"]
-
-	if repo.templates.globals["enable_docs"]:
+	if g["enable_docs"]:
 		yield "docs"
 
 
@@ -573,6 +767,11 @@ class IsolatedGitHubManager(GitHubManager):
 	:param managed_message: Message placed at the top of files to indicate that they are managed by ``repo_helper``.
 	:param verbose: Whether to show information on the GitHub API rate limit.
 	:param colour: Whether to use coloured output.
+
+	.. versionchanged:: 0.9.0
+
+		Can be used as a context manager,
+		which removes the temporary directory and closes the HTTP session on exit.
 	"""  # noqa: D400
 
 	def __init__(
@@ -586,22 +785,49 @@ class IsolatedGitHubManager(GitHubManager):
 			colour: ColourTrilean = True,
 			):
 
-		self._tmpdir = tempfile.TemporaryDirectory()
+		# RepoHelper can only read its configuration from disk,
+		# so keep the downloaded copy in memory-backed storage where the platform provides it,
+		# unless the user has chosen a temporary directory.
+		shm_dir = "/dev/shm"
+		tmp_root = shm_dir if "TMPDIR" not in os.environ and os.access(shm_dir, os.W_OK) else None
+		self._tmpdir = tempfile.TemporaryDirectory(dir=tmp_root)
+		self._finalizer = weakref.finalize(self, self._tmpdir.cleanup)
 
 		self.github = Github(token=token)
 		self.verbose = verbose
 		self.colour = resolve_color_default(colour)
+		self._authenticated_user = None
 
 		target_repo = PathPlus(self._tmpdir.name)
 		config_file_name = "repo_helper.yml"
 
-		github_repo: repos.Repository = self.github.repository(username, repo_name)
-		contents_from_github: contents.Contents = github_repo.file_contents(config_file_name)
-		(target_repo / config_file_name).write_bytes(contents_from_github.decoded)
+		# Request the raw file directly, rather than looking up the repository and decoding the base64 contents.
+		response = self.github._get(
+				self.github._build_url("repos", username, repo_name, "contents", config_file_name),
+				headers={"Accept": "application/vnd.github.v3.raw"},
+				)
+
+		if response.status_code != 200:
+			raise error_for(response)
+
+		(target_repo / config_file_name).write_bytes(response.content)
 
 		RepoHelper.__init__(self, target_repo, managed_message)
 
 		self.load_settings()
 
-	def __del__(self):
-		self._tmpdir.cleanup()
+	def close(self) -> None:
+		"""
+		Remove the temporary directory and close the HTTP session.
+
+		.. versionadded:: 0.9.0
+		"""
+
+		self._finalizer()
+		self.github.session.close()
+
+	def __enter__(self) -> "IsolatedGitHubManager":
+		return self
+
+	def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+		self.close()
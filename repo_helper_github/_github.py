@@ -23,11 +23,151 @@
 #  OR OTHER DEALINGS IN THE SOFTWARE.
 #
 
+# stdlib
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+from urllib.parse import urlsplit
+
 # 3rd party
+import click
 from github3 import GitHub
+from github3.session import GitHubSession
+from requests import PreparedRequest, Response
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# this package
+from repo_helper_github._types import _Rate
 
 __all__ = ["Github"]
 
+# Below this many remaining requests, spread the rest evenly over the time until the limit resets.
+_RATE_LIMIT_BUFFER = 100
+
+# The longest gap, in seconds, left between two requests when pacing them.
+_MAX_PACE_DELAY = 10
+
+# Retry transient failures and secondary rate limits, honouring any ``Retry-After`` header.
+# The final response is returned rather than raised so github3's error handling still applies.
+_RETRY = Retry(
+		total=5,
+		backoff_factor=1.5,
+		status_forcelist=(429, 502, 503, 504),
+		respect_retry_after_header=True,
+		raise_on_status=False,
+		)
+
+
+class _GitHubAdapter(HTTPAdapter):
+	# HTTPAdapter which retries transient failures, and calls ``before_send`` with each request before sending it.
+
+	def __init__(self, before_send: Callable[[PreparedRequest], None]):
+		super().__init__(max_retries=_RETRY)
+		self._before_send = before_send
+
+	def send(self, request: PreparedRequest, *args: Any, **kwargs: Any) -> Response:  # type: ignore[override]
+		self._before_send(request)
+		return super().send(request, *args, **kwargs)
+
+
+class Github(GitHub):
+	"""
+	Subclass of :class:`github3.github.GitHub` which records the rate limit
+	from the ``X-RateLimit-*`` headers of each response,
+	retries requests which fail with a transient error,
+	and spaces out requests when the rate limit is nearly exhausted.
+
+	Retries and pacing are only applied to the session the class creates itself.
+	The adapters of a ``session`` passed in are left as they are.
+	"""  # noqa: D400
+
+	#: The rate limit as of the most recent response from the API, or :py:obj:`None` if no responses have been received.
+	last_rate: Optional[_Rate] = None
+
+	def __init__(self, *args, session: Optional[GitHubSession] = None, **kwargs):
+		super().__init__(*args, session=session, **kwargs)
+		self._rate_limit_cache: Optional[Dict[str, Any]] = None
+		self.session.hooks["response"].append(self._record_rate_limit)
+
+		# Requests may be made from several threads at once.
+		# Their responses are recorded, and the requests paced, as one sequence.
+		self._rate_lock = threading.Lock()
+		self._next_request_time = 0.0
+
+		if session is None:
+			# The session was only just created, so replacing its default adapters loses no pooled connections
+			# and cannot discard adapters configured by the caller.
+			for prefix, adapter in list(self.session.adapters.items()):
+				if type(adapter) is HTTPAdapter:
+					self.session.mount(prefix, _GitHubAdapter(self._pace_request))
+
+	def rate_limit(self) -> Dict[str, Any]:
+		"""
+		Return a dictionary with information from ``/rate_limit``.
+
+		The request is conditional on the ``ETag`` of the previous response,
+		and the previous result is returned if the server reports it is unchanged.
+		"""
+
+		headers = {}
+		if self._rate_limit_cache is not None and self._rate_limit_cache.get("ETag"):
+			headers["If-None-Match"] = self._rate_limit_cache["ETag"]
+
+		response = self._get(self._build_url("rate_limit"), headers=headers)
+
+		if response.status_code == 304 and self._rate_limit_cache is not None:
+			return self._rate_limit_cache
+
+		self._rate_limit_cache = self._json(response, 200)
+		return self._rate_limit_cache  # type: ignore[return-value]
+
+	def _record_rate_limit(self, response: Response, *args: Any, **kwargs: Any) -> Response:
+		headers = response.headers
+
+		if "X-RateLimit-Remaining" in headers and headers.get("X-RateLimit-Resource", "core") == "core":
+			rate: _Rate = {
+					"remaining": int(headers["X-RateLimit-Remaining"]),
+					"reset": int(headers["X-RateLimit-Reset"]),
+					}
+
+			# Responses to concurrent requests can arrive in any order,
+			# so within one rate limit window keep the lowest count seen.
+			with self._rate_lock:
+				last_rate = self.last_rate
+
+				if (
+						last_rate is None or rate["reset"] > last_rate["reset"]
+						or (rate["reset"] == last_rate["reset"] and rate["remaining"] < last_rate["remaining"])
+						):
+					self.last_rate = rate
+
+		return response
+
+	def _pace_request(self, request: PreparedRequest) -> None:
+		# Called by the adapter before each request is sent.
+		# Requests to /rate_limit do not count against the limit, so are never delayed.
+
+		rate = self.last_rate
+
+		if rate is None or not 0 < rate["remaining"] < _RATE_LIMIT_BUFFER:
+			return
+
+		if urlsplit(request.path_url).path.rstrip('/').endswith("/rate_limit"):
+			return
+
+		with self._rate_lock:
+			now = time.time()
+			interval = min((rate["reset"] - now) / rate["remaining"], _MAX_PACE_DELAY)
+
+			if interval <= 0:
+				return
+
+			send_at = max(now, self._next_request_time)
+			self._next_request_time = send_at + interval
+
+		delay = send_at - now
 
-class Github(GitHub):  # noqa: D101
-	pass
+		if delay > 0:
+			click.echo(f"Only {rate['remaining']} GitHub API requests remaining. Waiting {delay:.1f}s.", err=True)
+			time.sleep(delay)
@@ -38,3 +38,8 @@ class _EditKwargs(TypedDict, total=False):
 	# allow_squash_merge: bool
 	# allow_merge_commit: bool
 	# allow_rebase_merge: bool
+
+
+class _Rate(TypedDict):
+	remaining: int
+	reset: int
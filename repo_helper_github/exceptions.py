@@ -38,6 +38,9 @@ __all__ = [
 		"TracebackHandler",
 		]
 
+# stdlib
+from typing import ClassVar
+
 # 3rd party
 from consolekit import tracebacks
 from consolekit.utils import abort
@@ -49,7 +52,33 @@ class GitHubException(ValueError):
 	"""
 
 
-class ErrorCreatingRepository(GitHubException):
+class _RepoException(GitHubException):
+	# Shared implementation of exceptions relating to a repository owned by a user or organization.
+
+	# Message format, given the repository, account_kind ("org" or "user") and username.
+	_message_template: ClassVar[str]
+
+	username: str
+	repository: str
+	org: bool
+	full_name: str
+
+	def __init__(self, username: str, repository: str, org: bool = False):
+		self.username = str(username)
+		self.repository = str(repository)
+		self.org = bool(org)
+		self.full_name = f"{self.username}/{self.repository}"
+
+		super().__init__(
+				self._message_template.format(
+						repository=self.repository,
+						account_kind="org" if self.org else "user",
+						username=self.username,
+						)
+				)
+
+
+class ErrorCreatingRepository(_RepoException):
 	"""
 	Exception raised when a repository cannot be created.
 
@@ -67,26 +96,13 @@ class ErrorCreatingRepository(GitHubException):
 	#: Whether the username is a GitHub organization.
 	org: bool
 
-	def __init__(self, username: str, repository: str, org: bool = False):
-		self.username = str(username)
-		self.repository = str(repository)
-		self.org = bool(org)
-
-		super().__init__(
-				f"Could not create repository {self.repository!r} "
-				f"for {'org' if self.org else 'user'} {self.username!r}."
-				)
-
-	@property
-	def full_name(self) -> str:
-		"""
-		The full name (``user/name``) of the repository being created.
-		"""
+	#: The full name (``user/name``) of the repository being created.
+	full_name: str
 
-		return f"{self.username}/{self.repository}"
+	_message_template = "Could not create repository {repository!r} for {account_kind} {username!r}."
 
 
-class NoSuchRepository(GitHubException):
+class NoSuchRepository(_RepoException):
 	"""
 	Exception raised when a repository does not exist.
 
@@ -104,23 +120,10 @@ class NoSuchRepository(GitHubException):
 	#: Whether the username is a GitHub organization.
 	org: bool
 
-	def __init__(self, username: str, repository: str, org: bool = False):
-		self.username = str(username)
-		self.repository = str(repository)
-		self.org = bool(org)
-
-		super().__init__(
-				f"No such repository {self.repository!r} "
-				f"for {'org' if self.org else 'user'} {self.username!r}."
-				)
-
-	@property
-	def full_name(self) -> str:
-		"""
-		The full name (``user/name``) of the repository which doesn't exist.
-		"""
+	#: The full name (``user/name``) of the repository which doesn't exist.
+	full_name: str
 
-		return f"{self.username}/{self.repository}"
+	_message_template = "No such repository {repository!r} for {account_kind} {username!r}."
 
 
 class NoSuchBranch(GitHubException):
@@ -27,21 +27,25 @@ Reusable options for click.
 #
 
 # stdlib
+from functools import lru_cache
 from typing import Callable, TypeVar
 
 # 3rd party
 import click
-from domdf_python_tools.stringlist import DelimitedList
 
 __all__ = ["version_callback", "org_option", "_C"]
 
 _C = TypeVar("_C", bound=click.Command)
 
 
+@lru_cache(maxsize=None)
 def org_option() -> Callable[[_C], _C]:
 	"""
 	Creates a ``--org`` option to specify that the repository belongs to an organisation.
 
+	The decorator is created once and shared between commands,
+	as click builds a new :class:`click.Option` each time it is applied.
+
 	.. versionadded: 0.3.0
 	"""
 
@@ -59,6 +63,7 @@ def org_option() -> Callable[[_C], _C]:
 def version_callback(ctx: click.Context, param: click.Option, value: int) -> None:  # noqa: D103
 	# 3rd party
 	import repo_helper
+	from domdf_python_tools.stringlist import DelimitedList
 
 	# this package
 	from repo_helper_github import __version__
@@ -30,13 +30,15 @@ Ensure secrets have the required format before setting them on GitHub.
 
 # stdlib
 import json
+import re
 from typing import List, Tuple
 
-# 3rd party
-from pymacaroons import Caveat, Macaroon  # type: ignore[import]
-
 __all__ = ["no_op_validator", "validate_pypi_token"]
 
+# Both base64 alphabets (and padding), as pymacaroons accepts either.
+# Even the smallest macaroon (just a 32 byte signature) encodes to more than 40 characters.
+_PYPI_TOKEN_RE = re.compile(r"pypi-[A-Za-z0-9_\-+/=]{40,}")
+
 
 def validate_pypi_token(token: str) -> Tuple[bool, str]:
 	"""
@@ -50,6 +52,13 @@ def validate_pypi_token(token: str) -> Tuple[bool, str]:
 	if not token.startswith("pypi-"):
 		return False, "The token should start with 'pypi-'."
 
+	# Reject tokens which cannot possibly be a macaroon before importing and running pymacaroons.
+	if _PYPI_TOKEN_RE.fullmatch(token) is None:
+		return False, "Could not decode token."
+
+	# 3rd party
+	from pymacaroons import Caveat, Macaroon  # type: ignore[import]
+
 	b64string = token[5:]
 	try:
 		macaroon = Macaroon.deserialize(b64string)
@@ -17,16 +17,19 @@ pytest_plugins = ("coincidence", "github3_utils.testing", "repo_helper.testing")
 
 @pytest.fixture()
 def temp_github_repo(temp_empty_repo, tmp_pathplus, example_config) -> PathPlus:
-	(tmp_pathplus / "repo_helper.yml").write_lines([
-			*example_config.splitlines()[:8],
-			*example_config.splitlines()[10:],
+	config_lines = example_config.splitlines()
+
+	# The list ends with an empty string, so joining it gives the trailing newline.
+	(tmp_pathplus / "repo_helper.yml").write_text('\n'.join([
+			*config_lines[:8],
+			*config_lines[10:],
 			'',
 			"keywords:",
 			"   - repo_helper",
 			"   - github",
 			"   - configuration",
 			'',
-			])
+			]))
 
 	return tmp_pathplus
 
@@ -46,9 +49,10 @@ def betamax_github_session(monkeypatch) -> GitHubSession:
 	monkeypatch.setenv("GITHUB_TOKEN", "FAKE_TOKEN")
 
 	session = GitHubSession()
+	original_init = Github.__init__
 
 	def __init__(self, username='', password='', token='', *args, **kwargs):
-		super(Github, self).__init__(username=username, password=password, token=token, session=session)
+		original_init(self, username=username, password=password, token=token, session=session)
 
 	monkeypatch.setattr(Github, "__init__", __init__)
 
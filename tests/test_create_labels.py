@@ -14,10 +14,10 @@ def test_create_labels(github_manager):
 	assert github_manager.create_labels() == 0
 
 	repo = github_manager.github.repository("domdfcoding", "repo_helper_demo")
-	current_labels = {label.name: label for label in repo.labels()}
+	current_labels = {label.name for label in repo.labels()}
 
-	for label in check_status_labels:
-		assert label in current_labels
+	missing = check_status_labels.keys() - current_labels
+	assert not missing, missing
 
 
 @pytest.mark.usefixtures("betamax_github_session", "module_cassette")
@@ -35,7 +35,7 @@ def test_via_cli(
 	result.check_stdout(advanced_file_regression, extension=".md")
 
 	repo = github_manager.github.repository("domdfcoding", "repo_helper_demo")
-	current_labels = {label.name: label for label in repo.labels()}
+	current_labels = {label.name for label in repo.labels()}
 
-	for label in check_status_labels:
-		assert label in current_labels
+	missing = check_status_labels.keys() - current_labels
+	assert not missing, missing
@@ -1,3 +1,6 @@
+# stdlib
+import re
+
 # 3rd party
 import pytest
 from coincidence.regressions import AdvancedFileRegressionFixture
@@ -16,7 +19,7 @@ def test_create_repo(github_manager, temp_github_repo):
 
 		github_manager.github.repository("domdfcoding", "repo_helper_demo")
 
-		with pytest.raises(UnprocessableEntity, match="422 Repository creation failed."):
+		with pytest.raises(UnprocessableEntity, match=re.escape("422 Repository creation failed.")):
 			github_manager.new()
 
 
@@ -36,5 +39,5 @@ def test_via_cli(
 	# Check the repository now exists
 	github_manager.github.repository("domdfcoding", "repo_helper_demo")
 
-	with pytest.raises(UnprocessableEntity, match="422 Repository creation failed."):
+	with pytest.raises(UnprocessableEntity, match=re.escape("422 Repository creation failed.")):
 		github_manager.new()
@@ -1,5 +1,6 @@
 # stdlib
 import re
+from typing import Dict
 
 # 3rd party
 import click
@@ -45,121 +46,89 @@ def test_GitHubException(exception: GitHubException):
 		raise exception
 
 
-def test_ErrorCreatingRepository():
-	exception = ErrorCreatingRepository("domdfcoding", "domdf_python_tools")
-	assert isinstance(exception, ErrorCreatingRepository)
-
-	assert exception.username == "domdfcoding"
-	assert isinstance(exception.username, str)
-
-	assert exception.repository == "domdf_python_tools"
-	assert isinstance(exception.repository, str)
-
-	assert exception.full_name == "domdfcoding/domdf_python_tools"
-	assert isinstance(exception.full_name, str)
-
-	assert not exception.org
-	assert isinstance(exception.org, bool)
-
-	with pytest.raises(
-			ErrorCreatingRepository,
-			match="Could not create repository 'domdf_python_tools' for user 'domdfcoding'."
-			):
-		raise exception
-
-	exception = ErrorCreatingRepository("domdfcoding", "domdf_python_tools", org=False)
-	assert isinstance(exception, ErrorCreatingRepository)
-
-	assert exception.username == "domdfcoding"
-	assert isinstance(exception.username, str)
-
-	assert exception.repository == "domdf_python_tools"
-	assert isinstance(exception.repository, str)
-
-	assert exception.full_name == "domdfcoding/domdf_python_tools"
-	assert isinstance(exception.full_name, str)
-
-	assert not exception.org
-	assert isinstance(exception.org, bool)
-
-	with pytest.raises(
-			ErrorCreatingRepository,
-			match="Could not create repository 'domdf_python_tools' for user 'domdfcoding'."
-			):
-		raise exception
-
-	exception = ErrorCreatingRepository("repo-helper", "whey", org=True)
+@pytest.mark.parametrize(
+		"kwargs, username, repository, message",
+		[
+				(
+						{},
+						"domdfcoding",
+						"domdf_python_tools",
+						"Could not create repository 'domdf_python_tools' for user 'domdfcoding'.",
+						),
+				(
+						{"org": False},
+						"domdfcoding",
+						"domdf_python_tools",
+						"Could not create repository 'domdf_python_tools' for user 'domdfcoding'.",
+						),
+				(
+						{"org": True},
+						"repo-helper",
+						"whey",
+						"Could not create repository 'whey' for org 'repo-helper'.",
+						),
+				]
+		)
+def test_ErrorCreatingRepository(kwargs: Dict[str, bool], username: str, repository: str, message: str):
+	exception = ErrorCreatingRepository(username, repository, **kwargs)
 	assert isinstance(exception, ErrorCreatingRepository)
 
-	assert exception.username == "repo-helper"
+	assert exception.username == username
 	assert isinstance(exception.username, str)
 
-	assert exception.repository == "whey"
+	assert exception.repository == repository
 	assert isinstance(exception.repository, str)
 
-	assert exception.full_name == "repo-helper/whey"
+	assert exception.full_name == f"{username}/{repository}"
 	assert isinstance(exception.full_name, str)
 
-	assert exception.org
+	assert exception.org is kwargs.get("org", False)
 	assert isinstance(exception.org, bool)
 
-	with pytest.raises(ErrorCreatingRepository, match="Could not create repository 'whey' for org 'repo-helper'."):
+	with pytest.raises(ErrorCreatingRepository, match=re.escape(message)):
 		raise exception
 
 
-def test_NoSuchRepository():
-	exception = NoSuchRepository("domdfcoding", "domdf_python_tools")
-	assert isinstance(exception, NoSuchRepository)
-
-	assert exception.username == "domdfcoding"
-	assert isinstance(exception.username, str)
-
-	assert exception.repository == "domdf_python_tools"
-	assert isinstance(exception.repository, str)
-
-	assert exception.full_name == "domdfcoding/domdf_python_tools"
-	assert isinstance(exception.full_name, str)
-
-	assert not exception.org
-	assert isinstance(exception.org, bool)
-
-	with pytest.raises(NoSuchRepository, match="No such repository 'domdf_python_tools' for user 'domdfcoding'."):
-		raise exception
-
-	exception = NoSuchRepository("domdfcoding", "domdf_python_tools", org=False)
-	assert isinstance(exception, NoSuchRepository)
-
-	assert exception.username == "domdfcoding"
-	assert isinstance(exception.username, str)
-
-	assert exception.repository == "domdf_python_tools"
-	assert isinstance(exception.repository, str)
-
-	assert exception.full_name == "domdfcoding/domdf_python_tools"
-	assert isinstance(exception.full_name, str)
-
-	assert not exception.org
-	assert isinstance(exception.org, bool)
-
-	with pytest.raises(NoSuchRepository, match="No such repository 'domdf_python_tools' for user 'domdfcoding'."):
-		raise exception
-
-	exception = NoSuchRepository("repo-helper", "whey", org=True)
+@pytest.mark.parametrize(
+		"kwargs, username, repository, message",
+		[
+				(
+						{},
+						"domdfcoding",
+						"domdf_python_tools",
+						"No such repository 'domdf_python_tools' for user 'domdfcoding'.",
+						),
+				(
+						{"org": False},
+						"domdfcoding",
+						"domdf_python_tools",
+						"No such repository 'domdf_python_tools' for user 'domdfcoding'.",
+						),
+				(
+						{"org": True},
+						"repo-helper",
+						"whey",
+						"No such repository 'whey' for org 'repo-helper'.",
+						),
+				]
+		)
+def test_NoSuchRepository(kwargs: Dict[str, bool], username: str, repository: str, message: str):
+	exception = NoSuchRepository(username, repository, **kwargs)
 	assert isinstance(exception, NoSuchRepository)
 
-	assert exception.username == "repo-helper"
+	assert exception.username == username
 	assert isinstance(exception.username, str)
 
-	assert exception.repository == "whey"
+	assert exception.repository == repository
 	assert isinstance(exception.repository, str)
 
-	assert exception.full_name == "repo-helper/whey"
+	assert exception.full_name == f"{username}/{repository}"
 	assert isinstance(exception.full_name, str)
 
-	assert exception.org
+	assert exception.org is kwargs.get("org", False)
 	assert isinstance(exception.org, bool)
 
-	with pytest.raises(NoSuchRepository, match="No such repository 'whey' for org 'repo-helper'."):
+	with pytest.raises(NoSuchRepository, match=re.escape(message)):
 		raise exception
 
 
@@ -177,7 +146,8 @@ def test_NoSuchBranch():
 	assert isinstance(exception.branch, str)
 
 	with pytest.raises(
-			NoSuchBranch, match="No such branch 'master' for repository 'domdfcoding/domdf_python_tools'."
+			NoSuchBranch,
+			match=re.escape("No such branch 'master' for repository 'domdfcoding/domdf_python_tools'.")
 			):
 		raise exception
 
@@ -193,7 +163,7 @@ def test_NoSuchBranch():
 	assert exception.branch == "main"
 	assert isinstance(exception.branch, str)
 
-	with pytest.raises(NoSuchBranch, match="No such branch 'main' for repository 'repo-helper/whey'."):
+	with pytest.raises(NoSuchBranch, match=re.escape("No such branch 'main' for repository 'repo-helper/whey'.")):
 		raise exception
 
 
@@ -1,14 +1,21 @@
 # stdlib
+import datetime
 import re
+from types import SimpleNamespace
 
 # 3rd party
 import pytest
 from coincidence.regressions import AdvancedFileRegressionFixture
 from consolekit.testing import CliRunner, Result
-from github3_utils import echo_rate_limit, get_user
+from github3.session import GitHubSession
+from github3_utils import RateLimitExceeded, echo_rate_limit, get_user
+from requests import Request, Response
+from requests.adapters import HTTPAdapter
 
 # this package
+import repo_helper_github
 from repo_helper_github import GitHubManager, OrganizationError, __version__
+from repo_helper_github._github import Github
 from repo_helper_github.cli import github
 
 
@@ -24,6 +31,217 @@ def test_rate_limit(
 	advanced_file_regression.check(capsys.readouterr().out)
 
 
+def test_last_rate(github_manager: GitHubManager):
+	assert github_manager.github.last_rate is None
+
+	response = Response()
+	response.headers["X-RateLimit-Remaining"] = "4863"
+	response.headers["X-RateLimit-Reset"] = "1609373045"
+	github_manager.github._record_rate_limit(response)
+
+	assert github_manager.github.last_rate == {"remaining": 4863, "reset": 1609373045}
+
+	response = Response()
+	response.headers["X-RateLimit-Remaining"] = "29"
+	response.headers["X-RateLimit-Reset"] = "1609373100"
+	response.headers["X-RateLimit-Resource"] = "search"
+	github_manager.github._record_rate_limit(response)
+
+	assert github_manager.github.last_rate == {"remaining": 4863, "reset": 1609373045}
+
+	# A concurrent request which completed later, but was counted earlier.
+	response = Response()
+	response.headers["X-RateLimit-Remaining"] = "4864"
+	response.headers["X-RateLimit-Reset"] = "1609373045"
+	github_manager.github._record_rate_limit(response)
+
+	assert github_manager.github.last_rate == {"remaining": 4863, "reset": 1609373045}
+
+	# The limit has since been reset.
+	response.headers["X-RateLimit-Remaining"] = "4999"
+	response.headers["X-RateLimit-Reset"] = "1609376645"
+	github_manager.github._record_rate_limit(response)
+
+	assert github_manager.github.last_rate == {"remaining": 4999, "reset": 1609376645}
+
+
+@pytest.fixture()
+def rate_limit_calls(github_manager: GitHubManager, monkeypatch):
+	calls = []
+
+	def rate_limit():
+		calls.append(True)
+		return {"rate": {"remaining": 100, "reset": 1609373100}}
+
+	monkeypatch.setattr(github_manager.github, "rate_limit", rate_limit)
+	monkeypatch.setattr(repo_helper_github.time, "time", lambda: 1609373000)
+
+	return calls
+
+
+def test_echo_rate_limit_verbose(github_manager: GitHubManager, rate_limit_calls, capsys):
+	response = Response()
+	response.headers["X-RateLimit-Remaining"] = "97"
+	response.headers["X-RateLimit-Reset"] = "1609373100"
+
+	with github_manager.echo_rate_limit():
+		github_manager.github._record_rate_limit(response)
+
+	reset = datetime.datetime.fromtimestamp(1609373100)
+	assert capsys.readouterr().out.splitlines() == [
+			"100 requests available.",
+			f"Used 3 requests. 97 remaining. Resets at {reset}",
+			]
+	assert len(rate_limit_calls) == 1
+
+
+def test_echo_rate_limit_no_requests(github_manager: GitHubManager, rate_limit_calls, capsys):
+	github_manager.github.last_rate = {"remaining": 100, "reset": 1609373100}
+
+	with github_manager.echo_rate_limit():
+		pass
+
+	assert capsys.readouterr().out.splitlines() == ["100 requests available."]
+	assert len(rate_limit_calls) == 1
+
+
+def test_echo_rate_limit_not_verbose(github_manager: GitHubManager, rate_limit_calls, capsys):
+	github_manager.verbose = False
+	github_manager.github.last_rate = {"remaining": 100, "reset": 1609373100}
+
+	with github_manager.echo_rate_limit():
+		github_manager.github.last_rate = {"remaining": 97, "reset": 1609373100}
+
+	assert not capsys.readouterr().out
+	assert rate_limit_calls == []
+
+
+def test_echo_rate_limit_exceeded(github_manager: GitHubManager, monkeypatch, capsys):
+	monkeypatch.setattr(
+			github_manager.github,
+			"rate_limit",
+			lambda: {"rate": {"remaining": 0, "reset": 1609373100}},
+			)
+	monkeypatch.setattr(repo_helper_github.time, "time", lambda: 1609373000)
+
+	with pytest.raises(RateLimitExceeded):
+		with github_manager.echo_rate_limit():
+			pytest.fail("The body should not be run.")
+
+	assert not capsys.readouterr().out
+
+
+def test_echo_rate_limit_exhausted(github_manager: GitHubManager, monkeypatch):
+	monkeypatch.setattr(repo_helper_github.time, "time", lambda: 1609373000)
+	github_manager.verbose = False
+
+	github_manager.github.last_rate = {"remaining": 0, "reset": 1609373100}
+
+	with pytest.raises(RateLimitExceeded):
+		with github_manager.echo_rate_limit():
+			pass
+
+	# The recorded limit has since been reset, so requests can be made again.
+	github_manager.github.last_rate = {"remaining": 0, "reset": 1609369400}
+
+	with github_manager.echo_rate_limit() as github:
+		assert github is github_manager.github
+
+
+def test_pace_requests(github_manager: GitHubManager, monkeypatch, capsys):
+	github = github_manager.github
+	delays = []
+	monkeypatch.setattr(repo_helper_github._github.time, "sleep", delays.append)
+	monkeypatch.setattr(repo_helper_github._github.time, "time", lambda: 1609373000)
+
+	request = Request("GET", "https://api.github.com/repos/domdfcoding/repo_helper_demo").prepare()
+	rate_limit_request = Request("GET", "https://api.github.com/rate_limit").prepare()
+
+	github.last_rate = {"remaining": 4863, "reset": 1609373100}
+	github._pace_request(request)
+	assert delays == []
+
+	# The first request is sent straight away, and later ones (from any thread) are spaced out.
+	github.last_rate = {"remaining": 50, "reset": 1609373100}
+	github._pace_request(request)
+	github._pace_request(request)
+	github._pace_request(request)
+	assert delays == [2.0, 4.0]
+	assert "Only 50 GitHub API requests remaining. Waiting 2.0s." in capsys.readouterr().err
+
+	# Checking the rate limit does not use up the quota.
+	github._pace_request(rate_limit_request)
+	assert delays == [2.0, 4.0]
+
+	# The gap between requests is capped.
+	github._next_request_time = 0
+	github.last_rate = {"remaining": 1, "reset": 1609376600}
+	github._pace_request(request)
+	github._pace_request(request)
+	assert delays == [2.0, 4.0, 10]
+
+
+def test_pace_requests_before_send(monkeypatch):
+	delays = []
+	monkeypatch.setattr(repo_helper_github._github.time, "sleep", delays.append)
+	monkeypatch.setattr(repo_helper_github._github.time, "time", lambda: 1609373000)
+	monkeypatch.setattr(HTTPAdapter, "send", lambda self, request, *args, **kwargs: Response())
+
+	github = Github(token="token")
+	github.last_rate = {"remaining": 50, "reset": 1609373100}
+
+	github.session.get("https://api.github.com/repos/domdfcoding/repo_helper_demo")
+	github.session.get("https://api.github.com/repos/domdfcoding/repo_helper_demo")
+
+	assert delays == [2.0]
+
+
+def test_retries():
+	github = Github(token="token")
+	retry = github.session.get_adapter("https://api.github.com").max_retries
+
+	assert retry.total == 5
+	assert set(retry.status_forcelist) == {429, 502, 503, 504}
+	assert retry.respect_retry_after_header
+
+
+def test_session_adapters_kept():
+	session = GitHubSession()
+	adapter = HTTPAdapter(pool_maxsize=50)
+	session.mount("https://", adapter)
+
+	github = Github(token="token", session=session)
+	assert github.session.get_adapter("https://api.github.com") is adapter
+
+	# A second client sharing the session does not take it over either.
+	Github(token="token", session=github.session)
+	assert github.session.get_adapter("https://api.github.com") is adapter
+
+
+def test_rate_limit_etag(github_manager: GitHubManager, monkeypatch):
+	sent_headers = []
+
+	def fake_get(url, headers=None):
+		sent_headers.append(headers)
+		response = Response()
+
+		if headers:
+			response.status_code = 304
+		else:
+			response.status_code = 200
+			response.headers["ETag"] = '"abc"'
+			response._content = b'{"rate": {"remaining": 4863}}'
+
+		return response
+
+	monkeypatch.setattr(github_manager.github, "_get", fake_get)
+
+	first = github_manager.github.rate_limit()
+	assert first["rate"] == {"remaining": 4863}
+	assert github_manager.github.rate_limit() is first
+	assert sent_headers == [{}, {"If-None-Match": '"abc"'}]
+
+
 @pytest.mark.usefixtures("cassette")
 def test_assert_org_member(
 		github_manager: GitHubManager,
@@ -43,13 +261,52 @@ def test_assert_org_member(
 	assert not capout.err
 
 
+def test_get_org_or_user_cached(github_manager: GitHubManager, monkeypatch):
+	calls = []
+	user = SimpleNamespace(login="domdfcoding")
+
+	def get_user(github):
+		calls.append(github)
+		return user
+
+	monkeypatch.setattr(repo_helper_github, "_utils_get_user", get_user)
+
+	assert github_manager.get_org_or_user() is user
+	assert github_manager.get_org_or_user() is user
+	assert calls == [github_manager.github]
+
+
+def test_load_settings_resets_owner(github_manager: GitHubManager, monkeypatch):
+	monkeypatch.setattr(
+			github_manager,
+			"assert_org_member",
+			lambda user: SimpleNamespace(login=github_manager.templates.globals["username"]),
+			)
+	monkeypatch.setattr(
+			github_manager,
+			"_get_repository",
+			lambda user, repository, org: SimpleNamespace(full_name=f"{user.login}/{repository}"),
+			)
+	github_manager._authenticated_user = SimpleNamespace(login="domdfcoding")
+
+	assert github_manager.get_org_or_user(org=True).login == "domdfcoding"
+	assert github_manager._get_repo(org=True).full_name == "domdfcoding/repo_helper_demo"
+
+	config_file = github_manager.target_repo / "repo_helper.yml"
+	config_file.write_text(config_file.read_text().replace('username: "domdfcoding"', 'username: "repo-helper"'))
+	github_manager.load_settings()
+
+	assert github_manager.get_org_or_user(org=True).login == "repo-helper"
+	assert github_manager._get_repo(org=True).full_name == "repo-helper/repo_helper_demo"
+
+
 def test_version():
 	runner = CliRunner()
 
 	result: Result = runner.invoke(github, args=["--version"])
 	assert result.exit_code == 0
-	assert re.match(f"repo_helper_github version {__version__}", result.stdout.rstrip())
+	assert re.match(f"repo_helper_github version {re.escape(__version__)}", result.stdout.rstrip())
 
 	result = runner.invoke(github, args=["--version", "--version"])
 	assert result.exit_code == 0
-	assert re.match(f"repo_helper_github version {__version__}, repo_helper .*", result.stdout.rstrip())
+	assert re.match(f"repo_helper_github version {re.escape(__version__)}, repo_helper .*", result.stdout.rstrip())
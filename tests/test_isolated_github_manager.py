@@ -0,0 +1,83 @@
+# stdlib
+import gc
+import os
+import tempfile
+
+# 3rd party
+import pytest
+from domdf_python_tools.paths import PathPlus
+from github3.exceptions import NotFoundError
+from requests import Response
+
+# this package
+from repo_helper_github import IsolatedGitHubManager
+from repo_helper_github._github import Github
+
+
+@pytest.fixture()
+def fake_contents(monkeypatch, example_config: str):
+	requests = []
+
+	def _get(self, url, headers=None):
+		requests.append((url, headers))
+		response = Response()
+
+		if url.endswith("/repos/domdfcoding/repo_helper_demo/contents/repo_helper.yml"):
+			response.status_code = 200
+			response._content = example_config.encode("UTF-8")
+		else:
+			response.status_code = 404
+			response._content = b'{"message": "Not Found"}'
+
+		return response
+
+	monkeypatch.setattr(Github, "_get", _get)
+
+	return requests
+
+
+def test_isolated_github_manager(fake_contents, monkeypatch):
+	monkeypatch.delenv("TMPDIR", raising=False)
+
+	with IsolatedGitHubManager("FAKE_TOKEN", "domdfcoding", "repo_helper_demo") as manager:
+		target_repo = PathPlus(manager.target_repo)
+
+		assert fake_contents == [(
+				"https://api.github.com/repos/domdfcoding/repo_helper_demo/contents/repo_helper.yml",
+				{"Accept": "application/vnd.github.v3.raw"},
+				)]
+		assert (target_repo / "repo_helper.yml").is_file()
+		assert manager.templates.globals["username"] == "domdfcoding"
+		assert manager.templates.globals["repo_name"] == "repo_helper_demo"
+
+		if os.access("/dev/shm", os.W_OK):
+			assert target_repo.parent == PathPlus("/dev/shm")
+
+	assert not target_repo.exists()
+
+	# Closing again is harmless.
+	manager.close()
+
+
+def test_isolated_github_manager_tmpdir(fake_contents, monkeypatch, tmp_pathplus: PathPlus):
+	monkeypatch.setenv("TMPDIR", str(tmp_pathplus))
+	monkeypatch.setattr(tempfile, "tempdir", None)
+
+	with IsolatedGitHubManager("FAKE_TOKEN", "domdfcoding", "repo_helper_demo") as manager:
+		assert PathPlus(manager.target_repo).parent == tmp_pathplus
+
+
+def test_isolated_github_manager_not_found(fake_contents):
+	with pytest.raises(NotFoundError):
+		IsolatedGitHubManager("FAKE_TOKEN", "domdfcoding", "not_a_repo")
+
+
+def test_isolated_github_manager_finalizer(fake_contents):
+	manager = IsolatedGitHubManager("FAKE_TOKEN", "domdfcoding", "repo_helper_demo")
+	target_repo = PathPlus(manager.target_repo)
+	assert target_repo.is_dir()
+
+	# The directory is removed when the manager is garbage collected, without close() being called.
+	del manager
+	gc.collect()
+	assert not target_repo.exists()
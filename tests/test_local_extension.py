@@ -0,0 +1,50 @@
+# stdlib
+import importlib.util
+import os
+from types import ModuleType
+
+# 3rd party
+import pytest
+from domdf_python_tools.paths import PathPlus
+
+
+@pytest.fixture(scope="module")
+def local_extension() -> ModuleType:
+	path = PathPlus(__file__).parent.parent / "doc-source" / "local_extension.py"
+	spec = importlib.util.spec_from_file_location("local_extension", str(path))
+	module = importlib.util.module_from_spec(spec)
+	spec.loader.exec_module(module)  # type: ignore[union-attr]
+	return module
+
+
+@pytest.mark.parametrize(
+		"content",
+		[
+				b"",
+				b"no match here",
+				b"abcabc",
+				b"xabcyabcz",
+				b"ababcabcab",
+				b"aaabcbcabc" * 3,
+				]
+		)
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 4, 5, 7, 1 << 18])
+def test_replace_in_file(
+		local_extension: ModuleType,
+		tmp_pathplus: PathPlus,
+		monkeypatch,
+		content: bytes,
+		chunk_size: int,
+		):
+	# Small chunks put the match across every possible chunk boundary.
+	monkeypatch.setattr(local_extension, "_CHUNK_SIZE", chunk_size)
+
+	filename = tmp_pathplus / "file.tex"
+	filename.write_bytes(content)
+	filename.chmod(0o640)
+
+	local_extension._replace_in_file(filename, b"abc", b"[REPLACED]")
+
+	assert filename.read_bytes() == content.replace(b"abc", b"[REPLACED]")
+	assert filename.stat().st_mode & 0o777 == 0o640
+	assert os.listdir(tmp_pathplus) == ["file.tex"]
@@ -1,12 +1,20 @@
+# stdlib
+from types import SimpleNamespace
+from typing import Type
+
 # 3rd party
 import pytest
 from coincidence.regressions import AdvancedFileRegressionFixture
 from consolekit.testing import CliRunner, Result
 from domdf_python_tools.paths import in_directory
+from github3.exceptions import NotFoundError, UnprocessableEntity
+from github3_utils.headers import LUKE_CAKE
+from requests import Response
 
 # this package
 from repo_helper_github import compile_required_checks
 from repo_helper_github.cli import protect_branch
+from repo_helper_github.exceptions import NoSuchBranch
 
 
 @pytest.mark.usefixtures("module_cassette")
@@ -36,3 +44,48 @@ def test_via_cli(
 	branch = repo.branch("master")
 
 	assert branch.protection().required_status_checks.contexts() == list(compile_required_checks(github_manager))
+
+
+@pytest.mark.parametrize(
+		"status_code, content, exception",
+		[
+				pytest.param(404, b'{"message": "Branch not found"}', NoSuchBranch, id="no_such_branch"),
+				pytest.param(404, b'{"message": "Not Found"}', NotFoundError, id="not_admin"),
+				pytest.param(404, b"Not Found", NotFoundError, id="not_json"),
+				pytest.param(422, b'{"message": "Validation Failed"}', UnprocessableEntity, id="unprocessable"),
+				]
+		)
+def test_protect_branch_errors(
+		github_manager,
+		monkeypatch,
+		status_code: int,
+		content: bytes,
+		exception: Type[Exception],
+		):
+	requests = []
+
+	def _put(url, json=None, headers=None):
+		requests.append((url, json, headers))
+		response = Response()
+		response.status_code = status_code
+		response._content = content
+		return response
+
+	repo = SimpleNamespace(
+			_api="https://api.github.com/repos/domdfcoding/repo_helper_demo",
+			_build_url=lambda *args, base_url: '/'.join([base_url, *args]),
+			_put=_put,
+			owner=SimpleNamespace(login="domdfcoding"),
+			name="repo_helper_demo",
+			)
+
+	github_manager.verbose = False
+	monkeypatch.setattr(github_manager, "_get_repo", lambda org: repo)
+
+	with pytest.raises(exception):
+		github_manager.protect_branch("not-a-branch")
+
+	(url, payload, headers), = requests
+	assert url == "https://api.github.com/repos/domdfcoding/repo_helper_demo/branches/not-a-branch/protection"
+	assert payload["required_status_checks"]["contexts"] == list(compile_required_checks(github_manager))
+	assert headers == LUKE_CAKE
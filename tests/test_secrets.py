@@ -1,5 +1,6 @@
 # stdlib
 import json
+from typing import Optional, Set, Tuple
 
 # 3rd party
 import pymacaroons  # type: ignore[import]
@@ -11,6 +12,11 @@ from github3.repos import Repository
 from repo_helper_github import validate_pypi_token
 
 
+def _list_secret_names(repo: Repository, secrets_url: URL) -> Set[str]:
+	raw_secrets = repo._json(repo._get(str(secrets_url), headers=repo.PREVIEW_HEADERS), 200)
+	return {secret["name"] for secret in raw_secrets["secrets"]}
+
+
 @pytest.mark.usefixtures("module_cassette", "example_config")
 def test_secrets(github_manager):
 	# vcr.config.match_options = ["method", "uri", "headers"]
@@ -19,8 +25,7 @@ def test_secrets(github_manager):
 
 	# List of existing secrets.
 	secrets_url = URL(repo._build_url("actions/secrets", base_url=repo._api))
-	raw_secrets = repo._json(repo._get(str(secrets_url), headers=repo.PREVIEW_HEADERS), 200)
-	existing_secrets = [secret["name"] for secret in raw_secrets["secrets"]]
+	existing_secrets = _list_secret_names(repo, secrets_url)
 
 	assert "PYPI_TOKEN" not in existing_secrets
 	assert "ANACONDA_TOKEN" not in existing_secrets
@@ -37,8 +42,7 @@ def test_secrets(github_manager):
 			)
 
 	# List of existing secrets.
-	raw_secrets = repo._json(repo._get(str(secrets_url), headers=repo.PREVIEW_HEADERS), 200)
-	existing_secrets = [secret["name"] for secret in raw_secrets["secrets"]]
+	existing_secrets = _list_secret_names(repo, secrets_url)
 
 	assert "PYPI_TOKEN" in existing_secrets
 	assert "ANACONDA_TOKEN" in existing_secrets
@@ -110,41 +114,49 @@ class TestValidatePyPIToken:
 	def test_not_b64(self, token: str):
 		assert validate_pypi_token(token) == (False, "Could not decode token.")
 
-	def test_wrong_location(self):
-		fake_macaroon = pymacaroons.Macaroon(
-				identifier=b"12345-67890",
-				signature="4eba1dde2d0866f550278e40bb354542",
-				location="github.com",
-				version=pymacaroons.MACAROON_V2,
-				)
-		fake_macaroon.add_first_party_caveat(json.dumps({"permissions": {"projects": ["dict2css"]}, "version": 1}))
-
-		assert validate_pypi_token(f"pypi-{fake_macaroon.serialize()}") == (False, "The token is not for PyPI.")
-
-	def test_no_caveats(self):
+	@pytest.mark.parametrize(
+			"location, caveat, expected",
+			[
+					pytest.param(
+							"github.com",
+							json.dumps({"permissions": {"projects": ["dict2css"]}, "version": 1}),
+							(False, "The token is not for PyPI."),
+							id="wrong_location",
+							),
+					pytest.param(
+							"pypi.org",
+							None,
+							(False, "The decoded output does not have the expected format."),
+							id="no_caveats",
+							),
+					pytest.param(
+							"pypi.org",
+							"foo=bar",
+							(False, "The decoded output does not have the expected format."),
+							id="caveat_not_json",
+							),
+					pytest.param(
+							"pypi.org",
+							json.dumps({"permissions": {"projects": ["dict2css"]}, "version": 1}),
+							(True, ''),
+							id="seemingly_valid",
+							),
+					]
+			)
+	def test_macaroon(self, location: str, caveat: Optional[str], expected: Tuple[bool, str]):
 		fake_macaroon = pymacaroons.Macaroon(
 				identifier=b"12345-67890",
 				signature="4eba1dde2d0866f550278e40bb354542",
-				location="pypi.org",
+				location=location,
 				version=pymacaroons.MACAROON_V2,
 				)
 
-		error_msg = "The decoded output does not have the expected format."
-		assert validate_pypi_token(f"pypi-{fake_macaroon.serialize()}") == (False, error_msg)
+		if caveat is not None:
+			fake_macaroon.add_first_party_caveat(caveat)
 
-	def test_caveat_not_json(self):
-		fake_macaroon = pymacaroons.Macaroon(
-				identifier=b"12345-67890",
-				signature="4eba1dde2d0866f550278e40bb354542",
-				location="pypi.org",
-				version=pymacaroons.MACAROON_V2,
-				)
-		fake_macaroon.add_first_party_caveat("foo=bar")
+		assert validate_pypi_token(f"pypi-{fake_macaroon.serialize()}") == expected
 
-		error_msg = "The decoded output does not have the expected format."
-		assert validate_pypi_token(f"pypi-{fake_macaroon.serialize()}") == (False, error_msg)
-
-	def test_seemingly_valid(self):
+	def test_standard_base64(self):
 		fake_macaroon = pymacaroons.Macaroon(
 				identifier=b"12345-67890",
 				signature="4eba1dde2d0866f550278e40bb354542",
@@ -153,4 +165,7 @@ class TestValidatePyPIToken:
 				)
 		fake_macaroon.add_first_party_caveat(json.dumps({"permissions": {"projects": ["dict2css"]}, "version": 1}))
 
-		assert validate_pypi_token(f"pypi-{fake_macaroon.serialize()}") == (True, '')
+		token = fake_macaroon.serialize().replace('-', '+').replace('_', '/')
+		assert '/' in token
+
+		assert validate_pypi_token(f"pypi-{token}") == (True, '')
@@ -5,15 +5,25 @@ from consolekit.testing import CliRunner, Result
 from domdf_python_tools.paths import in_directory
 
 # this package
+from repo_helper_github import GitHubManager
 from repo_helper_github.cli import update
 
+_EXPECTED_TOPICS = frozenset({"python", "repo-helper", "github", "configuration"})
+
+
+def _assert_repo_updated(github_manager: GitHubManager) -> None:
+	repo = github_manager.github.repository("domdfcoding", "repo_helper_demo")
+
+	assert set(repo.topics().names) == _EXPECTED_TOPICS
+	assert repo.description == "Update multiple configuration files, build scripts etc. from a single location."
+
 
 @pytest.mark.usefixtures("cassette")
 def test_update_topics(github_manager, ):
 	repo = github_manager.github.repository("domdfcoding", "repo_helper_demo")
 	github_manager.update_topics(repo)
 
-	assert set(repo.topics().names) == {"python", "repo-helper", "github", "configuration"}
+	assert set(repo.topics().names) == _EXPECTED_TOPICS
 
 
 @pytest.mark.usefixtures("module_cassette")
@@ -21,10 +31,7 @@ def test_update(github_manager, temp_github_repo):
 	with in_directory(temp_github_repo):
 		github_manager.update()
 
-	repo = github_manager.github.repository("domdfcoding", "repo_helper_demo")
-
-	assert set(repo.topics().names) == {"python", "repo-helper", "github", "configuration"}
-	assert repo.description == "Update multiple configuration files, build scripts etc. from a single location."
+	_assert_repo_updated(github_manager)
 
 
 @pytest.mark.usefixtures("betamax_github_session", "module_cassette")
@@ -41,7 +48,4 @@ def test_via_cli(
 	assert result.exit_code == 0
 
 	# Check the repository has been updated
-	repo = github_manager.github.repository("domdfcoding", "repo_helper_demo")
-
-	assert set(repo.topics().names) == {"python", "repo-helper", "github", "configuration"}
-	assert repo.description == "Update multiple configuration files, build scripts etc. from a single location."
+	_assert_repo_updated(github_manager)